@@ -9,15 +9,62 @@ A beginner-friendly Python project demonstrating:
 - Command-line interface design
 """
 
+import argparse
+import contextlib
+import hashlib
+import io
+import os
+import pickle
+import numpy as np
 import pandas as pd
+import matplotlib
+
+# Save plots without starting a GUI toolkit unless a window backend is asked for
+matplotlib.use(os.environ.get('DV_BACKEND', 'Agg'))
+
 import matplotlib.pyplot as plt
-import seaborn as sns
-import os
+from concurrent.futures import ProcessPoolExecutor
+import types
 from datetime import datetime
 
+try:
+    import numba
+except ImportError:
+    # numba is optional; the report falls back to NumPy reductions
+    numba = None
+
 # Set the style for better-looking plots
 plt.style.use('seaborn-v0_8')
-sns.set_palette("husl")
+# seaborn's "husl" palette, set directly so seaborn is not imported at startup
+plt.rcParams['axes.prop_cycle'] = plt.cycler(color=['#f77189', '#bb9832', '#50b131',
+                                                    '#36ada4', '#3ba3ec', '#e866f4'])
+
+# Columns the tool expects in the CSV file, with explicit types so pandas skips inference
+COLUMNS = ['Month', 'Sales', 'Expenses', 'Profit', 'Customers']
+# Money is float64 so large totals stay exact; Customers is nullable so blank cells still load
+COLUMN_DTYPES = {'Sales': 'float64', 'Expenses': 'float64', 'Profit': 'float64', 'Customers': 'Int32'}
+
+# Output resolution; DV_DPI=300 gives print-quality images. Figures are laid out
+# with tight_layout(), so savefig does not also need bbox_inches='tight'.
+_DPI = int(os.environ.get('DV_DPI', 150))
+
+# Fast zlib level for PNG encoding; charts compress well even at level 1
+_PNG_OPTIONS = {'compress_level': 1}
+
+# Backends that only write files and have no window to show
+_FILE_BACKENDS = {'agg', 'cairo', 'pdf', 'pgf', 'ps', 'svg', 'template'}
+
+# Empty figures pickled on first use, so later runs skip building axes, ticks and spines.
+# They live in the per-user cache folder, never in the plots output folder.
+if os.name == 'nt':
+    _CACHE_HOME = os.environ.get('LOCALAPPDATA', os.path.expanduser('~'))
+else:
+    _CACHE_HOME = os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache'))
+_TEMPLATE_DIR = os.path.join(_CACHE_HOME, 'datavisualizer', 'templates')
+
+# Figures built so far, keyed by plot type, so repeat menu choices only update data.
+# These are the only references kept once a figure is closed, so memory stays bounded.
+_FIG_CACHE = {}
 
 def display_banner():
     """Display the application banner."""
@@ -34,7 +81,11 @@ def load_data(filename="sample_data.csv"):
             print(f"Error: File '{filename}' not found.")
             return None
         
-        data = pd.read_csv(filename)
+        try:
+            data = pd.read_csv(filename, engine='pyarrow', usecols=COLUMNS, dtype=COLUMN_DTYPES)
+        except ImportError:
+            # pyarrow is optional; fall back to pandas' own C parser
+            data = pd.read_csv(filename, engine='c', usecols=COLUMNS, dtype=COLUMN_DTYPES)
         print(f"✓ Successfully loaded data from '{filename}'")
         print(f"  Dataset shape: {data.shape[0]} rows, {data.shape[1]} columns")
         print(f"  Columns: {', '.join(data.columns.tolist())}")
@@ -44,6 +95,16 @@ def load_data(filename="sample_data.csv"):
         print(f"Error loading data: {e}")
         return None
 
+def column_arrays(data):
+    """Extract the plotted columns as NumPy arrays once, for reuse by every plot."""
+    return types.SimpleNamespace(
+        month=data['Month'].to_numpy(),
+        sales=data['Sales'].to_numpy(),
+        expenses=data['Expenses'].to_numpy(),
+        profit=data['Profit'].to_numpy(),
+        customers=data['Customers'].to_numpy(dtype=float, na_value=np.nan),
+    )
+
 def display_data_preview(data):
     """Display a preview of the loaded data."""
     print("\n" + "="*60)
@@ -58,209 +119,383 @@ def display_data_preview(data):
     print("\nBasic statistics:")
     print(data.describe())
 
-def create_line_plot(data, save_path="plots"):
-    """Create a line plot showing trends over time."""
-    plt.figure(figsize=(12, 8))
+def timestamp():
+    """Return the current time formatted for use in plot filenames."""
+    return datetime.now().strftime('%Y%m%d_%H%M%S')
+
+def file_only_backend():
+    """Return True if the Matplotlib backend only writes files (e.g. the default Agg)."""
+    return matplotlib.get_backend().lower() in _FILE_BACKENDS
+
+def show_plot():
+    """Show the current figure, unless the backend only writes files."""
+    if not file_only_backend():
+        plt.show()
+
+def template_key():
+    """Return a key that changes whenever this file, matplotlib or the plot style changes."""
+    digest = hashlib.sha256()
+    with open(__file__, 'rb') as file:
+        digest.update(file.read())
+    digest.update(matplotlib.__version__.encode())
+    digest.update(repr(sorted(matplotlib.rcParams.items())).encode())
+    return digest.hexdigest()[:16]
+
+def load_template(kind, build):
+    """Load the empty (figure, artists) template for a plot type from disk, saving it on first use."""
+    path = os.path.join(_TEMPLATE_DIR, f"{kind}-{template_key()}.pkl")
+    try:
+        with open(path, 'rb') as file:
+            return pickle.load(file)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Rebuilding plot template '{path}': {e}")
     
-    # Create subplots for multiple metrics
+    entry = build()
+    try:
+        os.makedirs(_TEMPLATE_DIR, exist_ok=True)
+        # Write to a temporary file first so parallel workers never read a partial template
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as file:
+            pickle.dump(entry, file)
+        os.replace(temp_path, path)
+    except Exception as e:
+        print(f"Could not save plot template '{path}': {e}")
+    return entry
+
+def cached_figure(kind, build):
+    """Return the cached (figure, artists) pair for a plot type, building it on first use."""
+    entry = _FIG_CACHE.get(kind)
+    # Figures are closed after saving; a closed figure can still be saved again,
+    # but a window backend needs a fresh one to show
+    if entry is None or not file_only_backend():
+        entry = load_template(kind, build)
+        _FIG_CACHE[kind] = entry
+    return entry
+
+def build_line_plot():
+    """Build the line plot figure with an empty line for each metric."""
     fig, axes = plt.subplots(2, 2, figsize=(15, 10))
     fig.suptitle('Business Performance Trends', fontsize=16, fontweight='bold')
     
-    # Sales trend
-    axes[0, 0].plot(data['Month'], data['Sales'], marker='o', linewidth=2, markersize=6)
-    axes[0, 0].set_title('Monthly Sales Trend', fontweight='bold')
-    axes[0, 0].set_ylabel('Sales ($)')
-    axes[0, 0].tick_params(axis='x', rotation=45)
-    axes[0, 0].grid(True, alpha=0.3)
-    
-    # Profit trend
-    axes[0, 1].plot(data['Month'], data['Profit'], marker='s', color='green', linewidth=2, markersize=6)
-    axes[0, 1].set_title('Monthly Profit Trend', fontweight='bold')
-    axes[0, 1].set_ylabel('Profit ($)')
-    axes[0, 1].tick_params(axis='x', rotation=45)
-    axes[0, 1].grid(True, alpha=0.3)
-    
-    # Customer growth
-    axes[1, 0].plot(data['Month'], data['Customers'], marker='^', color='purple', linewidth=2, markersize=6)
-    axes[1, 0].set_title('Customer Growth', fontweight='bold')
-    axes[1, 0].set_ylabel('Number of Customers')
-    axes[1, 0].tick_params(axis='x', rotation=45)
-    axes[1, 0].grid(True, alpha=0.3)
-    
-    # Expenses trend
-    axes[1, 1].plot(data['Month'], data['Expenses'], marker='d', color='red', linewidth=2, markersize=6)
-    axes[1, 1].set_title('Monthly Expenses', fontweight='bold')
-    axes[1, 1].set_ylabel('Expenses ($)')
-    axes[1, 1].tick_params(axis='x', rotation=45)
-    axes[1, 1].grid(True, alpha=0.3)
-    
-    plt.tight_layout()
+    panels = [
+        (axes[0, 0], 'sales', 'Monthly Sales Trend', 'Sales ($)', dict(marker='o')),
+        (axes[0, 1], 'profit', 'Monthly Profit Trend', 'Profit ($)', dict(marker='s', color='green')),
+        (axes[1, 0], 'customers', 'Customer Growth', 'Number of Customers', dict(marker='^', color='purple')),
+        (axes[1, 1], 'expenses', 'Monthly Expenses', 'Expenses ($)', dict(marker='d', color='red')),
+    ]
+    
+    lines = {}
+    for ax, column, title, ylabel, style in panels:
+        lines[column] = ax.plot([], [], linewidth=2, markersize=6, **style)[0]
+        ax.set_title(title, fontweight='bold')
+        ax.set_ylabel(ylabel)
+        ax.tick_params(axis='x', rotation=45)
+        ax.grid(True, alpha=0.3)
+    
+    return fig, lines
+
+def create_line_plot(cols, save_path="plots", stamp=None):
+    """Create a line plot showing trends over time."""
+    # Reuse the figure from a previous call and only swap in the new data
+    fig, lines = cached_figure('line', build_line_plot)
+    x = range(len(cols.month))
+    
+    for column, line in lines.items():
+        line.set_data(x, getattr(cols, column))
+        ax = line.axes
+        ax.set_xticks(x, labels=cols.month)
+        ax.relim()
+        ax.autoscale_view()
+    
+    fig.tight_layout()
     
     # Save the plot
-    os.makedirs(save_path, exist_ok=True)
-    filename = f"{save_path}/line_plot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    filename = f"{save_path}/line_plot_{stamp or timestamp()}.png"
+    fig.savefig(filename, dpi=_DPI, pil_kwargs=_PNG_OPTIONS)
     print(f"✓ Line plot saved as: {filename}")
     
-    plt.show()
+    show_plot()
+    plt.close(fig)
     return filename
 
-def create_bar_chart(data, save_path="plots"):
-    """Create a bar chart comparing different metrics."""
-    plt.figure(figsize=(14, 8))
-    
-    # Set up the data for grouped bar chart
-    x = range(len(data['Month']))
-    width = 0.25
-    
+def build_bar_chart():
+    """Build the bar chart figure; bars are added on the first update."""
     fig, ax = plt.subplots(figsize=(14, 8))
     
-    # Create bars
-    bars1 = ax.bar([i - width for i in x], data['Sales'], width, label='Sales', alpha=0.8)
-    bars2 = ax.bar(x, data['Expenses'], width, label='Expenses', alpha=0.8)
-    bars3 = ax.bar([i + width for i in x], data['Profit'], width, label='Profit', alpha=0.8)
-    
     # Customize the chart
     ax.set_title('Monthly Financial Performance Comparison', fontsize=16, fontweight='bold')
     ax.set_xlabel('Month', fontweight='bold')
     ax.set_ylabel('Amount ($)', fontweight='bold')
-    ax.set_xticks(x)
-    ax.set_xticklabels(data['Month'], rotation=45)
-    ax.legend()
     ax.grid(True, alpha=0.3, axis='y')
     
-    # Add value labels on bars
-    def add_value_labels(bars):
-        for bar in bars:
-            height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + height*0.01,
-                   f'${height:,.0f}', ha='center', va='bottom', fontsize=8)
+    return fig, {'ax': ax, 'bars': [], 'labels': []}
+
+def create_bar_chart(cols, save_path="plots", stamp=None):
+    """Create a bar chart comparing different metrics."""
+    # Set up the data for grouped bar chart
+    x = np.arange(len(cols.month))
+    width = 0.25
     
-    add_value_labels(bars1)
-    add_value_labels(bars2)
-    add_value_labels(bars3)
+    fig, artists = cached_figure('bar', build_bar_chart)
+    ax = artists['ax']
+    bars = artists['bars']
+    
+    if bars and len(bars[0]) == len(x):
+        # Same number of months as last time: just update the bar heights
+        for container, values in zip(bars, [cols.sales, cols.expenses, cols.profit]):
+            for bar, height in zip(container, values):
+                bar.set_height(height)
+    else:
+        for container in bars:
+            container.remove()
+        
+        # Create bars
+        bars[:] = [
+            ax.bar(x - width, cols.sales, width, label='Sales', alpha=0.8),
+            ax.bar(x, cols.expenses, width, label='Expenses', alpha=0.8),
+            ax.bar(x + width, cols.profit, width, label='Profit', alpha=0.8),
+        ]
+        ax.legend()
+    
+    ax.set_xticks(x, labels=cols.month, rotation=45)
+    ax.relim()
+    ax.autoscale_view()
     
-    plt.tight_layout()
+    # Add value labels on bars
+    for text in artists['labels']:
+        text.remove()
+    artists['labels'] = []
+    # Label from the new values; a reused container's datavalues still hold the first call's data
+    for container, values in zip(bars, [cols.sales, cols.expenses, cols.profit]):
+        labels = [f'${value:,.0f}' for value in values]
+        artists['labels'].extend(ax.bar_label(container, labels=labels, fontsize=8, padding=2))
+    
+    fig.tight_layout()
     
     # Save the plot
-    os.makedirs(save_path, exist_ok=True)
-    filename = f"{save_path}/bar_chart_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    filename = f"{save_path}/bar_chart_{stamp or timestamp()}.png"
+    fig.savefig(filename, dpi=_DPI, pil_kwargs=_PNG_OPTIONS)
     print(f"✓ Bar chart saved as: {filename}")
     
-    plt.show()
+    show_plot()
+    plt.close(fig)
     return filename
 
-def create_scatter_plot(data, save_path="plots"):
-    """Create a scatter plot to show relationships between variables."""
+def linear_fit(x, y):
+    """Return the slope and intercept of the least-squares line through (x, y)."""
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # Fit on the complete pairs only; one NaN would make the whole line NaN
+    keep = ~(np.isnan(x) | np.isnan(y))
+    x = x[keep]
+    y = y[keep]
+    dx = x - x.mean()
+    slope = (dx * (y - y.mean())).sum() / (dx * dx).sum()
+    return slope, y.mean() - slope * x.mean()
+
+def build_scatter_plot():
+    """Build the scatter plot figure with empty points and trend lines."""
     fig, axes = plt.subplots(1, 2, figsize=(15, 6))
     fig.suptitle('Relationship Analysis', fontsize=16, fontweight='bold')
     
     # Sales vs Customers
-    axes[0].scatter(data['Customers'], data['Sales'], alpha=0.7, s=100, c=data['Profit'], cmap='viridis')
+    points1 = axes[0].scatter([], [], alpha=0.7, s=100, c=[], cmap='viridis')
+    trend1 = axes[0].plot([], [], "r--", alpha=0.8, linewidth=2)[0]
     axes[0].set_xlabel('Number of Customers', fontweight='bold')
     axes[0].set_ylabel('Sales ($)', fontweight='bold')
     axes[0].set_title('Sales vs Customers\n(Color = Profit)', fontweight='bold')
     axes[0].grid(True, alpha=0.3)
     
-    # Add trend line
-    z = np.polyfit(data['Customers'], data['Sales'], 1)
-    p = np.poly1d(z)
-    axes[0].plot(data['Customers'], p(data['Customers']), "r--", alpha=0.8, linewidth=2)
-    
     # Expenses vs Profit
-    axes[1].scatter(data['Expenses'], data['Profit'], alpha=0.7, s=100, c=data['Sales'], cmap='plasma')
+    points2 = axes[1].scatter([], [], alpha=0.7, s=100, c=[], cmap='plasma')
+    trend2 = axes[1].plot([], [], "r--", alpha=0.8, linewidth=2)[0]
     axes[1].set_xlabel('Expenses ($)', fontweight='bold')
     axes[1].set_ylabel('Profit ($)', fontweight='bold')
     axes[1].set_title('Expenses vs Profit\n(Color = Sales)', fontweight='bold')
     axes[1].grid(True, alpha=0.3)
     
-    # Add trend line
-    z2 = np.polyfit(data['Expenses'], data['Profit'], 1)
-    p2 = np.poly1d(z2)
-    axes[1].plot(data['Expenses'], p2(data['Expenses']), "r--", alpha=0.8, linewidth=2)
+    return fig, [(points1, trend1), (points2, trend2)]
+
+def create_scatter_plot(cols, save_path="plots", stamp=None):
+    """Create a scatter plot to show relationships between variables."""
+    fig, panels = cached_figure('scatter', build_scatter_plot)
+    
+    pairs = [(cols.customers, cols.sales, cols.profit), (cols.expenses, cols.profit, cols.sales)]
+    for (points, trend), (x, y, color) in zip(panels, pairs):
+        points.set_offsets(np.column_stack([x, y]))
+        points.set_array(color)
+        points.autoscale()
+        
+        # Add trend line
+        slope, intercept = linear_fit(x, y)
+        trend.set_data(x, slope * x + intercept)
+        
+        ax = points.axes
+        ax.relim()
+        ax.update_datalim(points.get_offsets())
+        ax.autoscale_view()
     
-    plt.tight_layout()
+    fig.tight_layout()
     
     # Save the plot
-    os.makedirs(save_path, exist_ok=True)
-    filename = f"{save_path}/scatter_plot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    filename = f"{save_path}/scatter_plot_{stamp or timestamp()}.png"
+    fig.savefig(filename, dpi=_DPI, pil_kwargs=_PNG_OPTIONS)
     print(f"✓ Scatter plot saved as: {filename}")
     
-    plt.show()
+    show_plot()
+    plt.close(fig)
     return filename
 
-def create_histogram(data, save_path="plots"):
-    """Create histograms to show data distribution."""
+def build_histogram():
+    """Build the histogram figure; the bars are added on the first update."""
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
     fig.suptitle('Data Distribution Analysis', fontsize=16, fontweight='bold')
     
-    # Sales distribution
-    axes[0, 0].hist(data['Sales'], bins=8, alpha=0.7, color='skyblue', edgecolor='black')
-    axes[0, 0].set_title('Sales Distribution', fontweight='bold')
-    axes[0, 0].set_xlabel('Sales ($)')
-    axes[0, 0].set_ylabel('Frequency')
-    axes[0, 0].grid(True, alpha=0.3)
-    
-    # Profit distribution
-    axes[0, 1].hist(data['Profit'], bins=8, alpha=0.7, color='lightgreen', edgecolor='black')
-    axes[0, 1].set_title('Profit Distribution', fontweight='bold')
-    axes[0, 1].set_xlabel('Profit ($)')
-    axes[0, 1].set_ylabel('Frequency')
-    axes[0, 1].grid(True, alpha=0.3)
-    
-    # Expenses distribution
-    axes[1, 0].hist(data['Expenses'], bins=8, alpha=0.7, color='lightcoral', edgecolor='black')
-    axes[1, 0].set_title('Expenses Distribution', fontweight='bold')
-    axes[1, 0].set_xlabel('Expenses ($)')
-    axes[1, 0].set_ylabel('Frequency')
-    axes[1, 0].grid(True, alpha=0.3)
-    
-    # Customers distribution
-    axes[1, 1].hist(data['Customers'], bins=8, alpha=0.7, color='plum', edgecolor='black')
-    axes[1, 1].set_title('Customers Distribution', fontweight='bold')
-    axes[1, 1].set_xlabel('Number of Customers')
-    axes[1, 1].set_ylabel('Frequency')
-    axes[1, 1].grid(True, alpha=0.3)
-    
-    plt.tight_layout()
+    panels = [
+        (axes[0, 0], 'sales', 'Sales Distribution', 'Sales ($)', 'skyblue'),
+        (axes[0, 1], 'profit', 'Profit Distribution', 'Profit ($)', 'lightgreen'),
+        (axes[1, 0], 'expenses', 'Expenses Distribution', 'Expenses ($)', 'lightcoral'),
+        (axes[1, 1], 'customers', 'Customers Distribution', 'Number of Customers', 'plum'),
+    ]
+    
+    hists = []
+    for ax, column, title, xlabel, color in panels:
+        ax.set_title(title, fontweight='bold')
+        ax.set_xlabel(xlabel)
+        ax.set_ylabel('Frequency')
+        ax.grid(True, alpha=0.3)
+        hists.append({'ax': ax, 'column': column, 'color': color, 'patches': None})
+    
+    return fig, hists
+
+def create_histogram(cols, save_path="plots", stamp=None):
+    """Create histograms to show data distribution."""
+    fig, hists = cached_figure('histogram', build_histogram)
+    
+    for hist in hists:
+        ax = hist['ax']
+        values = getattr(cols, hist['column'])
+        # np.histogram cannot bin NaN, so leave out the missing values as ax.hist did
+        counts, edges = np.histogram(values[~np.isnan(values)], bins=8)
+        widths = np.diff(edges)
+        
+        if hist['patches'] is None:
+            hist['patches'] = ax.bar(edges[:-1], counts, widths, align='edge', alpha=0.7,
+                                     color=hist['color'], edgecolor='black')
+        else:
+            # The bin count never changes, so move and resize the existing bars
+            for bar, left, width, count in zip(hist['patches'], edges[:-1], widths, counts):
+                bar.set_x(left)
+                bar.set_width(width)
+                bar.set_height(count)
+        ax.relim()
+        ax.autoscale_view()
+    
+    fig.tight_layout()
     
     # Save the plot
-    os.makedirs(save_path, exist_ok=True)
-    filename = f"{save_path}/histogram_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    filename = f"{save_path}/histogram_{stamp or timestamp()}.png"
+    fig.savefig(filename, dpi=_DPI, pil_kwargs=_PNG_OPTIONS)
     print(f"✓ Histogram saved as: {filename}")
     
-    plt.show()
+    show_plot()
+    plt.close(fig)
     return filename
 
-def create_heatmap(data, save_path="plots"):
+def create_heatmap(cols, save_path="plots", stamp=None):
     """Create a correlation heatmap."""
-    plt.figure(figsize=(10, 8))
-    
-    # Select only numeric columns for correlation
-    numeric_data = data.select_dtypes(include=['float64', 'int64'])
-    
-    # Calculate correlation matrix
-    correlation_matrix = numeric_data.corr()
-    
-    # Create heatmap
+    # Calculate correlation matrix; the DataFrame only supplies seaborn's axis labels
+    names = COLUMNS[1:]
+    values = np.column_stack([getattr(cols, name.lower()) for name in names])
+    # np.corrcoef has no NaN handling, so leave out months with a missing value
+    values = values[~np.isnan(values).any(axis=1)]
+    correlation_matrix = pd.DataFrame(np.corrcoef(values, rowvar=False), index=names, columns=names)
+    
+    # Reuse the figure, dropping the previous heatmap and its colorbar
+    fig, ax = cached_figure('heatmap', lambda: plt.subplots(figsize=(10, 8)))
+    if ax.collections and ax.collections[0].colorbar is not None:
+        ax.collections[0].colorbar.remove()
+    ax.cla()
+    
+    # Create heatmap; seaborn is only needed here, so import it on first use
+    import seaborn as sns
     sns.heatmap(correlation_matrix, annot=True, cmap='coolwarm', center=0,
-                square=True, fmt='.2f', cbar_kws={'shrink': 0.8})
+                square=True, fmt='.2f', cbar_kws={'shrink': 0.8}, ax=ax)
     
-    plt.title('Correlation Matrix Heatmap', fontsize=16, fontweight='bold', pad=20)
-    plt.tight_layout()
+    ax.set_title('Correlation Matrix Heatmap', fontsize=16, fontweight='bold', pad=20)
+    fig.tight_layout()
     
     # Save the plot
-    os.makedirs(save_path, exist_ok=True)
-    filename = f"{save_path}/heatmap_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png"
-    plt.savefig(filename, dpi=300, bbox_inches='tight')
+    filename = f"{save_path}/heatmap_{stamp or timestamp()}.png"
+    fig.savefig(filename, dpi=_DPI, pil_kwargs=_PNG_OPTIONS)
     print(f"✓ Heatmap saved as: {filename}")
     
-    plt.show()
+    show_plot()
+    plt.close(fig)
     return filename
 
+# Plot functions by the names accepted on the command line
+PLOT_FUNCTIONS = {
+    'line': create_line_plot,
+    'bar': create_bar_chart,
+    'scatter': create_scatter_plot,
+    'hist': create_histogram,
+    'heatmap': create_heatmap,
+}
+
+def init_plot_worker():
+    """Render with the file-only Agg backend in worker processes."""
+    matplotlib.use('Agg')
+
+def run_plot_quietly(function, cols, save_path, stamp):
+    """Create one plot in a worker, returning its filename and the messages it printed."""
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        filename = function(cols, save_path, stamp)
+    return filename, output.getvalue()
+
+def generate_all_plots(cols, save_path="plots", stamp=None):
+    """Create every plot type at once, in parallel worker processes when there are spare CPUs.
+    
+    A plot that fails is reported and skipped; the filenames of the others are returned.
+    """
+    # Count only the CPUs this process may run on, where the platform can tell us
+    if hasattr(os, 'sched_getaffinity'):
+        cpus = len(os.sched_getaffinity(0))
+    else:
+        cpus = os.cpu_count() or 1
+    workers = min(len(PLOT_FUNCTIONS), cpus)
+    if workers == 1:
+        # Starting a pool costs more than it saves on a single CPU
+        return create_plots(cols, list(PLOT_FUNCTIONS), save_path, stamp)
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_plot_worker) as executor:
+        futures = {name: executor.submit(run_plot_quietly, function, cols, save_path, stamp)
+                   for name, function in PLOT_FUNCTIONS.items()}
+        plot_files = []
+        for name, future in futures.items():
+            # Print from here, in order, so the workers' lines don't interleave
+            try:
+                filename, output = future.result()
+            except Exception as e:
+                print(f"Error creating {name} plot: {e}")
+                continue
+            print(output, end='')
+            plot_files.append(filename)
+        return plot_files
+
+def create_plots(cols, names, save_path="plots", stamp=None):
+    """Create the named plots one after another, reporting and skipping any that fail."""
+    plot_files = []
+    for name in names:
+        try:
+            plot_files.append(PLOT_FUNCTIONS[name](cols, save_path, stamp))
+        except Exception as e:
+            print(f"Error creating {name} plot: {e}")
+    return plot_files
+
 def display_menu():
     """Display the visualization menu."""
     print("\n" + "="*60)
@@ -288,8 +523,55 @@ def get_user_choice():
         except ValueError:
             print("Please enter a valid number.")
 
+def _summarize_metrics_numpy(sales, expenses, profit, customers):
+    """Return totals, averages, peak positions and growth rates for the report, skipping NaN."""
+    return (np.nansum(sales), np.nansum(expenses), np.nansum(profit),
+            np.nanmean(sales), np.nanmean(profit),
+            np.nanargmax(sales), np.nanargmax(profit),
+            (sales[-1] / sales[0] - 1) * 100, (customers[-1] / customers[0] - 1) * 100)
+
+def _summarize_metrics_loop(sales, expenses, profit, customers):
+    """Same results as _summarize_metrics_numpy in a single loop, written for numba to compile."""
+    total_sales = 0.0
+    total_expenses = 0.0
+    total_profit = 0.0
+    count_sales = 0
+    count_profit = 0
+    peak_sales = -1
+    peak_profit = -1
+    for i in range(len(sales)):
+        # NaN != NaN, so these checks skip missing values like pandas does
+        if sales[i] == sales[i]:
+            total_sales += sales[i]
+            count_sales += 1
+            if peak_sales < 0 or sales[i] > sales[peak_sales]:
+                peak_sales = i
+        if expenses[i] == expenses[i]:
+            total_expenses += expenses[i]
+        if profit[i] == profit[i]:
+            total_profit += profit[i]
+            count_profit += 1
+            if peak_profit < 0 or profit[i] > profit[peak_profit]:
+                peak_profit = i
+    return (total_sales, total_expenses, total_profit,
+            total_sales / count_sales, total_profit / count_profit,
+            peak_sales, peak_profit,
+            (sales[-1] / sales[0] - 1) * 100, (customers[-1] / customers[0] - 1) * 100)
+
+if numba is not None:
+    _summarize_metrics_jit = numba.njit(cache=True)(_summarize_metrics_loop)
+    summarize_metrics = _summarize_metrics_jit
+else:
+    summarize_metrics = _summarize_metrics_numpy
+
 def generate_analysis_report(data, plot_files):
     """Generate a simple analysis report."""
+    (total_sales, total_expenses, total_profit, mean_sales, mean_profit,
+     peak_sales, peak_profit, sales_growth, customer_growth) = summarize_metrics(
+        data['Sales'].to_numpy(), data['Expenses'].to_numpy(),
+        data['Profit'].to_numpy(), data['Customers'].to_numpy(dtype=float, na_value=np.nan))
+    months = data['Month']
+    
     report = f"""
 DATA ANALYSIS REPORT
 Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
@@ -297,43 +579,71 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 DATASET OVERVIEW:
 - Total records: {len(data)}
-- Time period: {data['Month'].iloc[0]} to {data['Month'].iloc[-1]}
+- Time period: {months.iloc[0]} to {months.iloc[-1]}
 
 KEY METRICS:
-- Total Sales: ${data['Sales'].sum():,}
-- Total Expenses: ${data['Expenses'].sum():,}
-- Total Profit: ${data['Profit'].sum():,}
-- Average Monthly Sales: ${data['Sales'].mean():,.0f}
-- Average Monthly Profit: ${data['Profit'].mean():,.0f}
-- Peak Sales Month: {data.loc[data['Sales'].idxmax(), 'Month']} (${data['Sales'].max():,})
-- Peak Profit Month: {data.loc[data['Profit'].idxmax(), 'Month']} (${data['Profit'].max():,})
+- Total Sales: ${total_sales:,.0f}
+- Total Expenses: ${total_expenses:,.0f}
+- Total Profit: ${total_profit:,.0f}
+- Average Monthly Sales: ${mean_sales:,.0f}
+- Average Monthly Profit: ${mean_profit:,.0f}
+- Peak Sales Month: {months.iloc[peak_sales]} (${data['Sales'].iloc[peak_sales]:,.0f})
+- Peak Profit Month: {months.iloc[peak_profit]} (${data['Profit'].iloc[peak_profit]:,.0f})
 
 GROWTH ANALYSIS:
-- Sales Growth: {((data['Sales'].iloc[-1] / data['Sales'].iloc[0]) - 1) * 100:.1f}%
-- Customer Growth: {((data['Customers'].iloc[-1] / data['Customers'].iloc[0]) - 1) * 100:.1f}%
-- Profit Margin (Average): {(data['Profit'].mean() / data['Sales'].mean()) * 100:.1f}%
+- Sales Growth: {sales_growth:.1f}%
+- Customer Growth: {customer_growth:.1f}%
+- Profit Margin (Average): {(mean_profit / mean_sales) * 100:.1f}%
 
 GENERATED VISUALIZATIONS:
 """
     
-    for i, plot_file in enumerate(plot_files, 1):
-        report += f"{i}. {os.path.basename(plot_file)}\n"
+    report += "".join(f"{i}. {os.path.basename(plot_file)}\n"
+                      for i, plot_file in enumerate(plot_files, 1))
     
     return report
 
-def save_report(report, filename="analysis_report.txt"):
-    """Save the analysis report to a file."""
+def save_report(report, filename="analysis_report.txt", sync=False):
+    """Save the analysis report to a file, forcing it to disk if sync is True."""
     try:
-        with open(filename, 'w') as file:
+        # A 64 KiB buffer holds the whole report, so it goes out in one write() call
+        with open(filename, 'w', buffering=1 << 16) as file:
             file.write(report)
+            if sync:
+                file.flush()
+                os.fsync(file.fileno())
         print(f"✓ Analysis report saved as: {filename}")
         return True
     except Exception as e:
         print(f"Error saving report: {e}")
         return False
 
-def main():
+def parse_args(argv=None):
+    """Parse the command-line options."""
+    parser = argparse.ArgumentParser(description="DataVisualizer - Professional Data Visualization Tool")
+    parser.add_argument('--plots', nargs='+', choices=[*PLOT_FUNCTIONS, 'all'],
+                        help="create these plots and the analysis report, then exit without showing the menu")
+    parser.add_argument('--sync', action='store_true',
+                        help="with --plots, fsync the analysis report so it is on disk before exiting")
+    return parser.parse_args(argv)
+
+def run_batch(data, cols, plots, save_path="plots", sync=False):
+    """Create the requested plots and the analysis report without any prompts."""
+    stamp = timestamp()
+    if 'all' in plots:
+        plot_files = generate_all_plots(cols, save_path, stamp)
+    else:
+        # dict.fromkeys drops repeated names but keeps their order
+        plot_files = create_plots(cols, dict.fromkeys(plots), save_path, stamp)
+    
+    # Report on whatever was produced, even if some plots failed
+    if plot_files:
+        report = generate_analysis_report(data, plot_files)
+        save_report(report, sync=sync)
+
+def main(argv=None):
     """Main application entry point."""
+    args = parse_args(argv)
     display_banner()
     
     # Load the data
@@ -342,6 +652,14 @@ def main():
         print("Cannot proceed without data. Exiting...")
         return
     
+    cols = column_arrays(data)
+    save_path = "plots"
+    os.makedirs(save_path, exist_ok=True)
+    
+    if args.plots:
+        run_batch(data, cols, args.plots, save_path, args.sync)
+        return
+    
     plot_files = []
     
     try:
@@ -369,32 +687,30 @@ def main():
             print("GENERATING VISUALIZATION...")
             print(f"{'='*60}")
             
+            # One timestamp for every file this menu choice produces
+            stamp = timestamp()
+            
             if choice == 1:
-                filename = create_line_plot(data)
+                filename = create_line_plot(cols, save_path, stamp)
                 plot_files.append(filename)
             elif choice == 2:
-                filename = create_bar_chart(data)
+                filename = create_bar_chart(cols, save_path, stamp)
                 plot_files.append(filename)
             elif choice == 3:
-                # Import numpy for trend lines
-                import numpy as np
-                filename = create_scatter_plot(data)
+                filename = create_scatter_plot(cols, save_path, stamp)
                 plot_files.append(filename)
             elif choice == 4:
-                filename = create_histogram(data)
+                filename = create_histogram(cols, save_path, stamp)
                 plot_files.append(filename)
             elif choice == 5:
-                filename = create_heatmap(data)
+                filename = create_heatmap(cols, save_path, stamp)
                 plot_files.append(filename)
             elif choice == 6:
                 print("Generating all visualizations...")
-                import numpy as np
-                plot_files.append(create_line_plot(data))
-                plot_files.append(create_bar_chart(data))
-                plot_files.append(create_scatter_plot(data))
-                plot_files.append(create_histogram(data))
-                plot_files.append(create_heatmap(data))
-                print("✓ All visualizations generated!")
+                new_files = generate_all_plots(cols, save_path, stamp)
+                plot_files.extend(new_files)
+                if len(new_files) == len(PLOT_FUNCTIONS):
+                    print("✓ All visualizations generated!")
             
             input("\nPress Enter to continue...")
     
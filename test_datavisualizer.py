@@ -0,0 +1,67 @@
+import os
+import types
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("matplotlib")
+
+import datavisualizer  # noqa: E402
+
+# One blank Sales and Profit cell each, like a CSV with missing values
+SALES = np.array([100.0, np.nan, 300.0, 250.0])
+EXPENSES = np.array([50.0, 60.0, np.nan, 80.0])
+PROFIT = np.array([50.0, 40.0, 230.0, np.nan])
+CUSTOMERS = np.array([10.0, np.nan, 30.0, 25.0])
+
+
+def test_numpy_summary_skips_missing_values():
+    result = datavisualizer._summarize_metrics_numpy(SALES, EXPENSES, PROFIT, CUSTOMERS)
+    assert result[:5] == pytest.approx((650.0, 190.0, 320.0, 650.0 / 3, 320.0 / 3))
+    assert result[5:7] == (2, 2)
+    assert result[7:] == pytest.approx((150.0, 150.0))
+
+
+def test_loop_summary_matches_numpy():
+    expected = datavisualizer._summarize_metrics_numpy(SALES, EXPENSES, PROFIT, CUSTOMERS)
+    result = datavisualizer._summarize_metrics_loop(SALES, EXPENSES, PROFIT, CUSTOMERS)
+    assert result == pytest.approx(expected)
+
+
+def test_jit_summary_matches_numpy():
+    pytest.importorskip("numba")
+    expected = datavisualizer._summarize_metrics_numpy(SALES, EXPENSES, PROFIT, CUSTOMERS)
+    result = datavisualizer._summarize_metrics_jit(SALES, EXPENSES, PROFIT, CUSTOMERS)
+    assert result == pytest.approx(expected)
+
+
+def test_linear_fit_ignores_incomplete_pairs():
+    # Complete pairs are (100, 50) and (300, 230): slope 0.9, intercept -40
+    slope, intercept = datavisualizer.linear_fit(SALES, PROFIT)
+    assert (slope, intercept) == pytest.approx((0.9, -40.0))
+
+
+def test_histogram_skips_missing_values(tmp_path, monkeypatch):
+    monkeypatch.setattr(datavisualizer, '_TEMPLATE_DIR', str(tmp_path / "templates"))
+    cols = types.SimpleNamespace(month=np.array(['Jan', 'Feb', 'Mar', 'Apr']), sales=SALES,
+                                 expenses=EXPENSES, profit=PROFIT, customers=CUSTOMERS)
+    filename = datavisualizer.create_histogram(cols, str(tmp_path), "test")
+    assert os.path.exists(filename)
+
+
+def test_batch_run_reports_plots_that_succeeded(tmp_path, monkeypatch, capsys):
+    def broken_plot(cols, save_path="plots", stamp=None):
+        raise ValueError("boom")
+
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(datavisualizer, '_TEMPLATE_DIR', str(tmp_path / "templates"))
+    monkeypatch.setitem(datavisualizer.PLOT_FUNCTIONS, 'hist', broken_plot)
+    data = pd.DataFrame({'Month': ['Jan', 'Feb'], 'Sales': [100.0, 200.0], 'Expenses': [50.0, 60.0],
+                         'Profit': [50.0, 140.0], 'Customers': [10.0, 12.0]})
+    datavisualizer.run_batch(data, datavisualizer.column_arrays(data), ['hist', 'line'], str(tmp_path), sync=False)
+
+    assert "Error creating hist plot: boom" in capsys.readouterr().out
+    with open("analysis_report.txt") as file:
+        report = file.read()
+    assert "1. line_plot_" in report